@@ -0,0 +1,451 @@
+"""
+End-to-end benchmarks for the hot path of every mosaic agent.
+
+Each benchmark builds a synthetic workload at a given scale, times individual
+calls with ``time.perf_counter_ns`` and measures peak memory in a separate
+``tracemalloc`` pass (tracing skews timings, so the two are never mixed).
+
+Usage:
+    python benchmarks/bench_agents.py                      # medium scale
+    python benchmarks/bench_agents.py --scale small --only process_command
+    python benchmarks/bench_agents.py --update-baseline    # store a new baseline
+    python benchmarks/bench_agents.py --threshold 0.15     # fail on >15% regression
+
+The comparison exits with status 1 on a regression and 2 when the baseline
+was recorded with a different scale, Python or metrics setting, or when no
+case matches it.
+
+Only the standard library is required, so the suite runs on a plain Linux box.
+"""
+import argparse
+import atexit
+import contextlib
+import gc
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from mosaic import metrics  # noqa: E402
+from mosaic.analytics import MosaicAnalytics  # noqa: E402
+from mosaic.commands import MosaicCommandLLM  # noqa: E402
+from mosaic.insights import UserBehaviorInsights  # noqa: E402
+from mosaic.security_agent import MosaicSecurityAgent  # noqa: E402
+from mosaic.tx_optimizer import MosaicOptimizer  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, 'benchmarks', 'baseline.json')
+DEFAULT_OUTPUT = 'bench_results.json'
+PERCENTILES = (50, 90, 99)
+
+# Report fields that must match the baseline for timings to be comparable
+COMPARABLE_META = ('scale', 'python', 'implementation', 'metrics_decorated', 'metrics_enabled')
+
+# Shared sink for agents that print on their hot path, opened once for all cases
+_DEVNULL = open(os.devnull, 'w')
+atexit.register(_DEVNULL.close)
+
+# Parameter grids per scale; every combination listed is benchmarked
+SCALES = {
+    'small': {
+        'process_command': [{'addresses': 10, 'patterns': 3}, {'addresses': 100, 'patterns': 20}],
+        'analyze_user_behavior': [{'users': 10, 'history': 10}, {'users': 100, 'history': 100}],
+        'monitor_transactions': [{'addresses': 1}, {'addresses': 10}],
+        'optimize_transaction': [{'history': 10}, {'history': 100}],
+        'predict_market_trends': [{'days': 7}, {'days': 30}],
+    },
+    'medium': {
+        'process_command': [{'addresses': 100, 'patterns': 3}, {'addresses': 1000, 'patterns': 20},
+                            {'addresses': 1000, 'patterns': 100}],
+        'analyze_user_behavior': [{'users': 100, 'history': 10}, {'users': 100, 'history': 100},
+                                  {'users': 1000, 'history': 1000}],
+        'monitor_transactions': [{'addresses': 1}, {'addresses': 10}, {'addresses': 100}],
+        'optimize_transaction': [{'history': 100}, {'history': 1000}, {'history': 10000}],
+        'predict_market_trends': [{'days': 7}, {'days': 30}, {'days': 365}],
+    },
+    'large': {
+        'process_command': [{'addresses': 1000, 'patterns': 3}, {'addresses': 10000, 'patterns': 100},
+                            {'addresses': 100000, 'patterns': 500}],
+        'analyze_user_behavior': [{'users': 1000, 'history': 100}, {'users': 1000, 'history': 1000},
+                                  {'users': 1000, 'history': 2000}],
+        'monitor_transactions': [{'addresses': 10}, {'addresses': 100}, {'addresses': 1000}],
+        'optimize_transaction': [{'history': 1000}, {'history': 10000}, {'history': 100000}],
+        'predict_market_trends': [{'days': 30}, {'days': 365}, {'days': 3650}],
+    },
+}
+
+
+def _address(i: int) -> str:
+    """
+    Builds a deterministic base58-looking address accepted by the command patterns.
+
+    :param i: Index of the address
+    :return: A 44 character address string
+    """
+    return f"Addr{i:040d}"
+
+
+def setup_process_command(addresses: int, patterns: int) -> Callable[[], str]:
+    """
+    Builds a MosaicCommandLLM processor with a populated ledger and extra
+    non-matching patterns placed ahead of the real ones.
+
+    :param addresses: Number of addresses in the simulated ledger
+    :param patterns: Total number of command patterns to scan
+    :return: A callable executing one command per call
+    """
+    llm = MosaicCommandLLM()
+    real_patterns = llm.command_patterns
+    filler = max(patterns - len(real_patterns), 0)
+    llm.command_patterns = {rf"noop{i} (\d+) to ([A-Za-z0-9]{{32,44}})": llm.send_sol for i in range(filler)}
+    llm.command_patterns.update(real_patterns)
+
+    llm.blockchain['balances']['ExampleAddress1'] = 10 ** 18  # Never run out of funds while sending
+    for i in range(addresses):
+        llm.blockchain['balances'][_address(i)] = random.randint(0, 10 ** 12)
+        llm.blockchain['transactions'][_address(i)] = [f"tx{i}_{j}" for j in range(random.randint(0, 10))]
+
+    commands = []
+    for i in range(256):
+        address = _address(random.randrange(addresses))
+        commands.append(random.choice([
+            f"query balance of {address}",
+            f"get transaction history for {address}",
+            f"send 0.001 SOL to {address}",
+            "unknown command",
+        ]))
+
+    sender_history = llm.blockchain['transactions']['ExampleAddress1']
+    seeded = len(sender_history)
+    state = {'i': 0}
+
+    def op() -> str:
+        command = commands[state['i'] % len(commands)]
+        state['i'] += 1
+        result = llm.process_command(command)
+        # send_sol appends to the sender's history; drop it to keep the ledger a fixed size
+        del sender_history[seeded:]
+        return result
+
+    return op
+
+
+def setup_analyze_user_behavior(users: int, history: int) -> Callable[[], Dict]:
+    """
+    Builds a UserBehaviorInsights instance with synthetic interaction histories
+    spread over the last thirty days.
+
+    :param users: Number of users with recorded interactions
+    :param history: Number of interactions per user
+    :return: A callable analyzing one user per call
+    """
+    insights = UserBehaviorInsights()
+    now = datetime.now()
+    types = ['transaction', 'query', 'staking', 'smart_contract']
+    for u in range(users):
+        insights.user_data[f"user{u}"] = [
+            {
+                'timestamp': (now - timedelta(minutes=random.randint(0, 30 * 24 * 60))).isoformat(),
+                'type': random.choice(types),
+                'details': {'amount': random.randint(1, 10 ** 9)}
+            }
+            for _ in range(history)
+        ]
+
+    state = {'i': 0}
+
+    def op() -> Dict:
+        user_id = f"user{state['i'] % users}"
+        state['i'] += 1
+        return insights.analyze_user_behavior(user_id)
+
+    return op
+
+
+def setup_monitor_transactions(addresses: int) -> Callable[[], None]:
+    """
+    Builds a MosaicSecurityAgent monitoring the given number of addresses.
+    Alerts are printed by the agent, so stdout is sent to the null device.
+
+    :param addresses: Number of monitored addresses
+    :return: A callable running one monitoring sweep per call
+    """
+    agent = MosaicSecurityAgent("https://api.devnet.solana.com")
+    for i in range(addresses):
+        agent.add_monitored_address(_address(i))
+
+    def op() -> None:
+        agent.alerts.clear()  # Keep memory bounded across iterations
+        with contextlib.redirect_stdout(_DEVNULL):
+            agent.monitor_transactions()
+
+    return op
+
+
+def setup_optimize_transaction(history: int) -> Callable[[], Dict]:
+    """
+    Builds a MosaicOptimizer with pre-populated historical transaction data.
+
+    :param history: Number of historical records to seed
+    :return: A callable optimizing one transaction per call
+    """
+    optimizer = MosaicOptimizer()
+    now = datetime.now()
+    optimizer.historical_data = [
+        {
+            'time': now - timedelta(minutes=random.randint(0, 7 * 24 * 60)),
+            'congestion': random.random(),
+            'fee': random.randint(0, 10000)
+        }
+        for _ in range(history)
+    ]
+
+    def op() -> Dict:
+        result = optimizer.optimize_transaction(1000000000, "RecipientPublicKeyHere", urgency=random.randint(1, 10))
+        # optimize_transaction appends a record; drop it so every call scans exactly `history` records
+        del optimizer.historical_data[history:]
+        return result
+
+    return op
+
+
+def setup_predict_market_trends(days: int) -> Callable[[], Dict]:
+    """
+    Builds a MosaicAnalytics instance predicting over the given horizon.
+
+    :param days: Number of days to predict into the future
+    :return: A callable producing one prediction per call
+    """
+    analytics = MosaicAnalytics()
+    tokens = list(analytics.token_data)
+    state = {'i': 0}
+
+    def op() -> Dict:
+        token = tokens[state['i'] % len(tokens)]
+        state['i'] += 1
+        return analytics.predict_market_trends(token, days)
+
+    return op
+
+
+BENCHMARKS = {
+    'process_command': setup_process_command,
+    'analyze_user_behavior': setup_analyze_user_behavior,
+    'monitor_transactions': setup_monitor_transactions,
+    'optimize_transaction': setup_optimize_transaction,
+    'predict_market_trends': setup_predict_market_trends,
+}
+
+
+def _percentile(sorted_samples: List[int], pct: float) -> int:
+    """
+    Nearest-rank percentile of already sorted samples.
+
+    :param sorted_samples: Samples in ascending order
+    :param pct: Percentile between 0 and 100
+    :return: The sample at the requested percentile
+    """
+    rank = max(math.ceil(pct / 100 * len(sorted_samples)) - 1, 0)
+    return sorted_samples[min(rank, len(sorted_samples) - 1)]
+
+
+def run_benchmark(name: str, params: Dict, min_time: float, max_iterations: int, seed: int) -> Dict:
+    """
+    Runs a single benchmark case: a timed pass followed by a memory pass.
+
+    :param name: Name of the benchmark in BENCHMARKS
+    :param params: Workload parameters passed to the setup function
+    :param min_time: Minimum seconds to spend in the timed pass
+    :param max_iterations: Upper bound on iterations in the timed pass
+    :param seed: Seed for the random module, for reproducible workloads
+    :return: Dictionary with throughput, latency percentiles and peak memory
+    """
+    setup = BENCHMARKS[name]
+
+    # Timed pass
+    random.seed(seed)
+    op = setup(**params)
+    for _ in range(min(10, max_iterations)):  # Warm-up
+        op()
+    samples = []
+    gc.collect()
+    clock = time.perf_counter_ns
+    deadline = clock() + int(min_time * 1e9)
+    started = clock()
+    while len(samples) < max_iterations:
+        t0 = clock()
+        op()
+        t1 = clock()
+        samples.append(t1 - t0)
+        if t1 >= deadline and len(samples) >= 5:
+            break
+    elapsed = clock() - started
+
+    # Memory pass: peak covers building the workload and a handful of calls. The
+    # timed workload is released first so the two are never alive at once.
+    del op
+    random.seed(seed)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        op = setup(**params)
+        for _ in range(min(len(samples), 20)):
+            op()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    samples.sort()
+    return {
+        'benchmark': name,
+        'params': params,
+        'iterations': len(samples),
+        'throughput_ops': len(samples) / (elapsed / 1e9),
+        'latency_ns': {
+            'min': samples[0],
+            'mean': sum(samples) / len(samples),
+            **{f"p{pct}": _percentile(samples, pct) for pct in PERCENTILES},
+            'max': samples[-1],
+        },
+        'peak_memory_bytes': peak,
+    }
+
+
+def case_key(result: Dict) -> str:
+    """
+    Stable identifier for a benchmark case, used to match against the baseline.
+
+    :param result: A result dictionary produced by run_benchmark
+    :return: A string such as "process_command[addresses=100,patterns=3]"
+    """
+    params = ','.join(f"{k}={v}" for k, v in sorted(result['params'].items()))
+    return f"{result['benchmark']}[{params}]"
+
+
+def compare_to_baseline(results: List[Dict], baseline: Dict, threshold: float) -> List[Dict]:
+    """
+    Compares median latency of each case to the baseline.
+
+    :param results: Current benchmark results
+    :param baseline: A previously saved report
+    :param threshold: Allowed relative slowdown, e.g. 0.1 for 10%
+    :return: List of comparisons with a 'regression' flag for each matched case
+    """
+    previous = {case_key(r): r for r in baseline.get('results', [])}
+    comparisons = []
+    for result in results:
+        key = case_key(result)
+        if key not in previous:
+            continue
+        old = previous[key]['latency_ns']['p50']
+        new = result['latency_ns']['p50']
+        change = (new - old) / old if old else 0.0
+        comparisons.append({
+            'case': key,
+            'baseline_p50_ns': old,
+            'current_p50_ns': new,
+            'change': change,
+            'regression': change > threshold
+        })
+    return comparisons
+
+
+def _format_ns(ns: float) -> str:
+    """
+    Formats a duration in nanoseconds with a human friendly unit.
+
+    :param ns: Duration in nanoseconds
+    :return: Formatted duration
+    """
+    for unit, scale in (('s', 1e9), ('ms', 1e6), ('us', 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f}{unit}"
+    return f"{ns:.0f}ns"
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the hot path of every mosaic agent.")
+    parser.add_argument('--scale', choices=sorted(SCALES), default='medium', help="Workload scale")
+    parser.add_argument('--only', action='append', choices=sorted(BENCHMARKS), help="Run only these benchmarks")
+    parser.add_argument('--min-time', type=float, default=0.5, help="Minimum seconds per case")
+    parser.add_argument('--max-iterations', type=int, default=100000, help="Maximum iterations per case")
+    parser.add_argument('--seed', type=int, default=1234, help="Random seed for the synthetic workloads")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="Where to write the JSON report")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Baseline report to compare against")
+    parser.add_argument('--threshold', type=float, default=0.10, help="Allowed median latency regression")
+    parser.add_argument('--update-baseline', action='store_true', help="Write the report to the baseline path")
+    args = parser.parse_args(argv)
+
+    results = []
+    for name, grid in SCALES[args.scale].items():
+        if args.only and name not in args.only:
+            continue
+        for params in grid:
+            result = run_benchmark(name, params, args.min_time, args.max_iterations, args.seed)
+            results.append(result)
+            latency = result['latency_ns']
+            print(f"{case_key(result):<60} {result['throughput_ops']:>12.1f} ops/s"
+                  f"  p50 {_format_ns(latency['p50']):>9}  p90 {_format_ns(latency['p90']):>9}"
+                  f"  p99 {_format_ns(latency['p99']):>9}  peak {result['peak_memory_bytes'] / 1024:>10.1f} KiB")
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'scale': args.scale,
+            'seed': args.seed,
+            'metrics_decorated': metrics._decorate,
+            'metrics_enabled': metrics.is_enabled(),
+        },
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline updated at {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline found at {args.baseline}; run with --update-baseline to create one.")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    mismatched = [key for key in COMPARABLE_META if baseline.get('meta', {}).get(key) != report['meta'][key]]
+    if mismatched:
+        for key in mismatched:
+            print(f"Baseline {key} is {baseline.get('meta', {}).get(key)!r}, this run is {report['meta'][key]!r}")
+        print("Results are not comparable with the baseline; rerun with matching settings or --update-baseline.")
+        return 2
+    comparisons = compare_to_baseline(results, baseline, args.threshold)
+    if not comparisons:
+        print("No case matched the baseline; nothing was compared.")
+        return 2
+    regressions = [c for c in comparisons if c['regression']]
+    for c in comparisons:
+        flag = "REGRESSION" if c['regression'] else "ok"
+        print(f"{c['case']:<60} {_format_ns(c['baseline_p50_ns']):>9} -> {_format_ns(c['current_p50_ns']):>9}"
+              f"  {c['change']:+.1%}  {flag}")
+    if regressions:
+        print(f"{len(regressions)} case(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Measures cold-start import time of the mosaic package and checks that the
+Solana SDK is only loaded when a navigator is needed.
+
+Every scenario runs in a fresh interpreter. The reported import time is taken
+inside the child process, and the wall time covers the whole process
+including interpreter startup.
+
+Usage:
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --runs 50 --output import_results.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Statements timed in a fresh interpreter; none of them may load solana
+SCENARIOS = {
+    'interpreter': 'pass',
+    'import mosaic': 'import mosaic',
+    'mosaic.MosaicAnalytics': 'import mosaic; mosaic.MosaicAnalytics',
+    'mosaic.MosaicSecurityAgent': 'import mosaic; mosaic.MosaicSecurityAgent',
+    'all non-navigator agents': ('import mosaic; [getattr(mosaic, n) for n in mosaic.__all__ '
+                                 'if n not in ("MosaicNavigator", "__version__")]'),
+    'mosaic.navigators module': 'import mosaic.navigators',
+    'mosaic.cli': 'import mosaic.cli; mosaic.cli.build_parser()',
+}
+
+CHILD = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, any(m == 'solana' or m.startswith('solana.') for m in sys.modules))
+"""
+
+
+def run_scenario(statement: str, runs: int) -> Dict:
+    """
+    Runs a statement in fresh interpreters and collects timings.
+
+    :param statement: Python statement to time
+    :param runs: Number of fresh interpreters to start
+    :return: Dictionary with median/min import and wall times and whether solana was loaded
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get('PYTHONPATH')])))
+    code = CHILD.format(statement=statement)
+    import_times, wall_times, solana_loaded = [], [], False
+    for _ in range(runs):
+        start = time.perf_counter()
+        out = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True)
+        wall_times.append(time.perf_counter() - start)
+        elapsed, loaded = out.stdout.split()
+        import_times.append(float(elapsed))
+        solana_loaded = solana_loaded or loaded == 'True'
+    return {
+        'import_ms_median': statistics.median(import_times) * 1e3,
+        'import_ms_min': min(import_times) * 1e3,
+        'wall_ms_median': statistics.median(wall_times) * 1e3,
+        'wall_ms_min': min(wall_times) * 1e3,
+        'solana_loaded': solana_loaded,
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure mosaic cold-start import time.")
+    parser.add_argument('--runs', type=int, default=20, help="Fresh interpreters per scenario")
+    parser.add_argument('--output', help="Optional path to write the results as JSON")
+    args = parser.parse_args(argv)
+
+    # Warm the bytecode cache so the first scenario is not charged for compilation
+    run_scenario('import mosaic.cli, mosaic.analytics, mosaic.commands, mosaic.insights, mosaic.llm, '
+                 'mosaic.navigators, mosaic.security_agent, mosaic.tx_optimizer', 1)
+
+    results = {}
+    for name, statement in SCENARIOS.items():
+        result = run_scenario(statement, args.runs)
+        results[name] = result
+        print(f"{name:<28} import {result['import_ms_median']:7.2f} ms (min {result['import_ms_min']:6.2f})"
+              f"  process {result['wall_ms_median']:7.2f} ms"
+              f"  solana {'LOADED' if result['solana_loaded'] else 'not loaded'}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    leaked = [name for name, result in results.items() if result['solana_loaded']]
+    if leaked:
+        print(f"Solana SDK loaded without constructing a navigator: {', '.join(leaked)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
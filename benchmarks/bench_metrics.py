@@ -0,0 +1,102 @@
+"""
+Measures the per-call overhead of the mosaic.metrics instrumentation.
+
+Compares a bare method against the same method wrapped with ``@instrumented``,
+with recording enabled and disabled at runtime, and fails if the enabled
+overhead exceeds its budget (1 microsecond per call by default) or the
+disabled overhead exceeds its own, tighter budget (500 ns by default).
+
+Usage:
+    python benchmarks/bench_metrics.py
+    python benchmarks/bench_metrics.py --calls 2000000 --budget-ns 800 --disabled-budget-ns 300
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Callable, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from mosaic import metrics  # noqa: E402
+from mosaic.metrics import MetricsRegistry, instrumented  # noqa: E402
+
+
+class Target:
+    def bare(self, value: int) -> int:
+        return value + 1
+
+
+Target.wrapped = instrumented(Target.bare, name='bench.wrapped', registry=MetricsRegistry())
+
+
+def time_per_call(func: Callable[[int], int], calls: int) -> float:
+    """
+    Average time of a single call.
+
+    :param func: Callable taking one integer argument
+    :param calls: Number of calls to time
+    :return: Nanoseconds per call
+    """
+    start = time.perf_counter_ns()
+    for i in range(calls):
+        func(i)
+    return (time.perf_counter_ns() - start) / calls
+
+
+def set_enabled(enabled: bool):
+    """
+    Turns metrics recording on or off.
+
+    :param enabled: Whether instrumented methods should record
+    """
+    if enabled:
+        metrics.enable()
+    else:
+        metrics.disable()
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure mosaic.metrics per-call overhead.")
+    parser.add_argument('--calls', type=int, default=200000, help="Calls per repetition")
+    parser.add_argument('--repeat', type=int, default=10, help="Repetitions, the fastest one is reported")
+    parser.add_argument('--budget-ns', type=float, default=1000.0, help="Allowed overhead per call when enabled")
+    parser.add_argument('--disabled-budget-ns', type=float, default=500.0,
+                        help="Allowed overhead per call when disabled with metrics.disable()")
+    args = parser.parse_args(argv)
+
+    if not metrics._decorate:
+        print("MOSAIC_METRICS is off: decorated methods are not wrapped, overhead is zero.")
+        return 0
+
+    target = Target()
+    variants = (('bare', target.bare, True), ('enabled', target.wrapped, True), ('disabled', target.wrapped, False))
+    best = {}
+    # Variants are interleaved within each repetition so that drift in machine
+    # load affects all of them alike; the fastest repetition of each is kept
+    for _ in range(args.repeat):
+        for label, func, enabled in variants:
+            set_enabled(enabled)
+            elapsed = time_per_call(func, args.calls)
+            best[label] = min(best.get(label, elapsed), elapsed)
+    metrics.enable()
+    bare, enabled, disabled = best['bare'], best['enabled'], best['disabled']
+
+    print(f"bare method:          {bare:8.1f} ns/call")
+    print(f"instrumented, on:     {enabled:8.1f} ns/call  (+{enabled - bare:.1f} ns)")
+    print(f"instrumented, off:    {disabled:8.1f} ns/call  (+{disabled - bare:.1f} ns)")
+
+    failed = False
+    if enabled - bare > args.budget_ns:
+        print(f"Enabled overhead exceeds the budget of {args.budget_ns:.0f} ns per call")
+        failed = True
+    if disabled - bare > args.disabled_budget_ns:
+        print(f"Disabled overhead exceeds the budget of {args.disabled_budget_ns:.0f} ns per call")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""
+mosaic - AI agents for the Solana blockchain.
+
+Agents are loaded lazily on first attribute access, so ``import mosaic`` stays
+cheap and processes that never touch the navigator never load the Solana SDK.
+"""
+import importlib
+
+__version__ = '0.1.0'
+
+# Maps each public name to the submodule defining it. typing is deliberately not
+# imported here: on its own it costs more than the rest of the package import.
+_LAZY_ATTRIBUTES = {
+    'MosaicLLM': 'mosaic.llm',
+    'MosaicCommandLLM': 'mosaic.commands',
+    'MosaicAnalytics': 'mosaic.analytics',
+    'MosaicNavigator': 'mosaic.navigators',
+    'UserBehaviorInsights': 'mosaic.insights',
+    'MosaicOptimizer': 'mosaic.tx_optimizer',
+    'MosaicSecurityAgent': 'mosaic.security_agent',
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES) + ['__version__']
+
+
+def __getattr__(name: str):
+    """
+    Imports the submodule defining an agent on first access and caches the result.
+
+    :param name: Name of the attribute being looked up
+    :return: The requested agent class
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
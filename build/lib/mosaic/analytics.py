@@ -1,6 +1,7 @@
 from typing import Dict, List
 import random  # For simulation purposes
 from datetime import datetime, timedelta
+from .metrics import instrumented
 
 class MosaicAnalytics:
     def __init__(self):
@@ -19,6 +20,7 @@ class MosaicAnalytics:
             'staking_rate': 0.7  # 70% of total SOL staked
         }
 
+    @instrumented
     def predict_market_trends(self, token: str, days: int = 7) -> Dict:
         """
         Simulates market trend prediction using historical data.
@@ -42,6 +44,7 @@ class MosaicAnalytics:
         
         return predictions
 
+    @instrumented
     def analyze_token_performance(self, token: str) -> Dict:
         """
         Analyzes the performance of a given token on Solana.
@@ -62,6 +65,7 @@ class MosaicAnalytics:
         
         return performance
 
+    @instrumented
     def assess_ecosystem_health(self) -> Dict:
         """
         Provides insights into the overall health of the Solana ecosystem.
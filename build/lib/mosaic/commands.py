@@ -1,10 +1,11 @@
 from typing import Dict, Any
 import re
+from .metrics import instrumented
 
-class MosaicLLM:
+class MosaicCommandLLM:
     def __init__(self):
         """
-        Initialize the MosaicLLM with command patterns and a simulated blockchain interaction layer.
+        Initialize the MosaicCommandLLM with command patterns and a simulated blockchain interaction layer.
         """
         # Dictionary to map natural language commands to blockchain operations
         self.command_patterns = {
@@ -26,6 +27,7 @@ class MosaicLLM:
             }
         }
 
+    @instrumented
     def process_command(self, user_input: str) -> str:
         """
         Process natural language input to execute blockchain operations.
@@ -40,6 +42,7 @@ class MosaicLLM:
         
         return "I'm sorry, I didn't understand that command. Please try again or ask for help."
 
+    @instrumented
     def send_sol(self, amount: str, recipient: str) -> str:
         """
         Simulates sending SOL to a recipient address.
@@ -65,6 +68,7 @@ class MosaicLLM:
         else:
             return "Insufficient balance to complete the transaction."
 
+    @instrumented
     def query_balance(self, address: str) -> str:
         """
         Simulates querying the balance of a given address.
@@ -78,6 +82,7 @@ class MosaicLLM:
         else:
             return f"Address {address} not found or has no balance."
 
+    @instrumented
     def get_transaction_history(self, address: str) -> str:
         """
         Simulates retrieving the transaction history for an address.
@@ -93,7 +98,7 @@ class MosaicLLM:
 
 # Example usage
 if __name__ == "__main__":
-    mosaic_llm = MosaicLLM()
+    mosaic_llm = MosaicCommandLLM()
     
     # Simulate user interaction
     print(mosaic_llm.process_command("send 0.5 SOL to ExampleAddress2"))
@@ -1,5 +1,6 @@
 from typing import Dict, List
 from datetime import datetime
+from .metrics import instrumented
 
 class UserBehaviorInsights:
     def __init__(self):
@@ -8,6 +9,7 @@ class UserBehaviorInsights:
         """
         self.user_data = {}  # Dictionary to store user interaction data
 
+    @instrumented
     def record_interaction(self, user_id: str, interaction_type: str, details: Dict):
         """
         Records a user's interaction with the blockchain.
@@ -26,6 +28,7 @@ class UserBehaviorInsights:
         }
         self.user_data[user_id].append(interaction)
 
+    @instrumented
     def analyze_user_behavior(self, user_id: str) -> Dict:
         """
         Analyzes the behavior of a specific user based on recorded interactions.
@@ -100,4 +103,10 @@ if __name__ == "__main__":
     insights_tool = UserBehaviorInsights()
     
     # Simulate user interactions
-    insights_tool.record_interaction('user1', 'transaction', {'
+    insights_tool.record_interaction('user1', 'transaction', {'amount': 1000000000, 'recipient': 'Address2'})
+    insights_tool.record_interaction('user1', 'query', {'address': 'Address1'})
+    insights_tool.record_interaction('user1', 'staking', {'amount': 500000000, 'validator': 'Validator1'})
+    
+    # Analyze the user's behavior
+    insights = insights_tool.analyze_user_behavior('user1')
+    print(f"User Behavior Insights for user1: {insights}")
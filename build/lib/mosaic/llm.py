@@ -1,4 +1,5 @@
 from typing import Dict, List
+from .metrics import instrumented
 
 class MosaicLLM:
     def __init__(self):
@@ -27,6 +28,7 @@ class MosaicLLM:
             'User3': 'advanced'
         }
 
+    @instrumented
     def generate_content(self, topic: str, user_id: str) -> str:
         """
         Generates educational content based on the topic and the user's knowledge level.
@@ -44,6 +46,7 @@ class MosaicLLM:
         
         return self.knowledge_base[topic][user_level]
 
+    @instrumented
     def adapt_knowledge_level(self, user_id: str, feedback: str) -> str:
         """
         Adapts the user's knowledge level based on feedback.
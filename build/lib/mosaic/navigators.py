@@ -1,9 +1,5 @@
 from typing import Dict, List
-from solana.rpc.api import Client
-from solana.publickey import PublicKey
-from solana.transaction import Transaction
-from solana.system_program import TransferParams, transfer
-from solana.stake_program import StakeProgram
+from .metrics import instrumented
 
 class MosaicNavigator:
     def __init__(self, rpc_url: str, user_public_key: str):
@@ -13,10 +9,16 @@ class MosaicNavigator:
         :param rpc_url: URL of the Solana RPC node
         :param user_public_key: User's public key on Solana
         """
+        # The Solana SDK is imported on construction rather than at module level,
+        # so processes that never create a navigator do not pay for loading it
+        from solana.rpc.api import Client
+        from solana.publickey import PublicKey
+
         self.client = Client(rpc_url)
         self.user_public_key = PublicKey(user_public_key)
-        self.stake_program = StakeProgram(self.client)
+        self.stake_program = None  # Created on first stake, see stake_sol
 
+    @instrumented
     def stake_sol(self, amount: int, validator_public_key: str):
         """
         Automates the process of staking SOL to a validator based on user criteria.
@@ -24,6 +26,15 @@ class MosaicNavigator:
         :param amount: Amount of SOL to stake in lamports
         :param validator_public_key: Public key of the validator to stake with
         """
+        from solana.publickey import PublicKey
+        from solana.transaction import Transaction
+
+        if self.stake_program is None:
+            # No solana-py release ships solana.stake_program, so this raises
+            # ModuleNotFoundError until a stake program implementation is provided
+            from solana.stake_program import StakeProgram
+            self.stake_program = StakeProgram(self.client)
+
         # Create a new stake account
         stake_account = self.stake_program.create_stake_account(self.user_public_key, amount)
         
@@ -40,6 +51,7 @@ class MosaicNavigator:
         print(f"Staking {amount / 1e9} SOL to validator {validator_public_key}")
         # Here you would typically sign and send the transaction, but we're simulating
 
+    @instrumented
     def interact_with_smart_contract(self, contract_address: str, function_name: str, args: List):
         """
         Simulates interaction with a smart contract on Solana.
@@ -53,6 +65,7 @@ class MosaicNavigator:
         print(f"Calling function: {function_name} with arguments: {args}")
         # Here you would typically construct, sign, and send a transaction to call the function
 
+    @instrumented
     def guide_user(self, user_criteria: Dict):
         """
         Guides the user through blockchain operations based on predefined criteria.
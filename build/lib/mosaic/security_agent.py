@@ -1,6 +1,7 @@
 from typing import Dict, List
 from datetime import datetime
 import random  # For simulation purposes
+from .metrics import instrumented
 
 class MosaicSecurityAgent:
     def __init__(self, rpc_url: str):
@@ -18,6 +19,7 @@ class MosaicSecurityAgent:
         }
         self.alerts = []  # Store alerts
 
+    @instrumented
     def add_monitored_address(self, address: str):
         """
         Add an address to be monitored for security threats.
@@ -27,6 +29,7 @@ class MosaicSecurityAgent:
         if address not in self.monitored_addresses:
             self.monitored_addresses.append(address)
 
+    @instrumented
     def monitor_transactions(self):
         """
         Simulates monitoring transactions for unusual patterns or threats.
@@ -95,6 +98,7 @@ class MosaicSecurityAgent:
         self.alerts.append(alert)
         print(f"Alert: {alert}")
 
+    @instrumented
     def get_recommendations(self, address: str) -> List[str]:
         """
         Provides security recommendations based on detected threats.
@@ -1,6 +1,7 @@
 from typing import Dict, List
 from datetime import datetime, timedelta
 import random  # For simulation purposes
+from .metrics import instrumented
 
 class MosaicOptimizer:
     def __init__(self):
@@ -14,6 +15,7 @@ class MosaicOptimizer:
             'priority_fee': 0  # Initial priority fee, will be adjusted
         }
 
+    @instrumented
     def analyze_network_congestion(self) -> float:
         """
         Simulates analysis of current network congestion on Solana.
@@ -24,6 +26,7 @@ class MosaicOptimizer:
         self.current_network_congestion = random.uniform(0, 1)
         return self.current_network_congestion
 
+    @instrumented
     def predict_best_transaction_time(self, time_window: int = 24) -> datetime:
         """
         Predicts the optimal time for a transaction based on historical data and current congestion.
@@ -39,6 +42,7 @@ class MosaicOptimizer:
         future_time = lowest_congestion_time['time'] + timedelta(hours=random.randint(0, time_window))
         return future_time if future_time > now else now
 
+    @instrumented
     def calculate_optimal_fee(self, urgency: int = 1) -> Dict:
         """
         Calculates the optimal fee structure based on urgency and network conditions.
@@ -57,6 +61,7 @@ class MosaicOptimizer:
             'priority_fee': int(priority_fee)
         }
 
+    @instrumented
     def optimize_transaction(self, amount: int, recipient: str, urgency: int = 1) -> Dict:
         """
         Optimizes a transaction by determining the best time and fee structure.
@@ -89,6 +94,7 @@ class MosaicOptimizer:
             'fee': optimal_fee
         }
 
+    @instrumented
     def simulate_transaction(self, transaction_details: Dict):
         """
         Simulates the execution of a transaction with the optimized parameters.
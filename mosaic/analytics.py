@@ -0,0 +1,79 @@
+from typing import Dict, List
+import random  # For simulation purposes
+from datetime import datetime, timedelta
+from .metrics import instrumented
+
+class MosaicAnalytics:
+    def __init__(self):
+        """
+        Initialize the MosaicAnalytics with simulated data for Solana ecosystem analysis.
+        """
+        self.token_data = {
+            'SOL': {'price': 100, 'volume_24h': 1000000, 'market_cap': 10000000000},
+            'mosaic': {'price': 1, 'volume_24h': 100000, 'market_cap': 10000000},
+            # Add more tokens as needed
+        }
+        self.historical_data = []  # To store historical price data for trend prediction
+        self.ecosystem_health = {
+            'tps': 2000,  # Transactions per second
+            'active_validators': 1000,
+            'staking_rate': 0.7  # 70% of total SOL staked
+        }
+
+    @instrumented
+    def predict_market_trends(self, token: str, days: int = 7) -> Dict:
+        """
+        Simulates market trend prediction using historical data.
+
+        :param token: The token to predict trends for
+        :param days: Number of days to predict into the future
+        :return: Dictionary with predicted price trends
+        """
+        if token not in self.token_data:
+            return {"error": f"Token {token} not found in the database."}
+        
+        # Simulate using historical data for trend prediction
+        current_price = self.token_data[token]['price']
+        trend = random.choice([-1, 0, 1])  # -1 for bearish, 0 for neutral, 1 for bullish
+        
+        predictions = {}
+        for day in range(1, days + 1):
+            change = random.uniform(-0.05, 0.05) if trend == 0 else random.uniform(-0.1, 0.1) * trend
+            predicted_price = current_price * (1 + change)
+            predictions[datetime.now() + timedelta(days=day)] = round(predicted_price, 2)
+        
+        return predictions
+
+    @instrumented
+    def analyze_token_performance(self, token: str) -> Dict:
+        """
+        Analyzes the performance of a given token on Solana.
+
+        :param token: The token to analyze
+        :return: Dictionary with performance metrics
+        """
+        if token not in self.token_data:
+            return {"error": f"Token {token} not found in the database."}
+        
+        performance = self.token_data[token].copy()
+        performance['price_change_24h'] = random.uniform(-5, 5)  # Simulated 24h price change in %
+        performance['volume_change_24h'] = random.uniform(-20, 20)  # Simulated 24h volume change in %
+        
+        # Simulate additional metrics
+        performance['volatility'] = random.uniform(0.01, 0.1)  # Simulated volatility
+        performance['market_sentiment'] = random.choice(['Positive', 'Neutral', 'Negative'])
+        
+        return performance
+
+    @instrumented
+    def assess_ecosystem_health(self) -> Dict:
+        """
+        Provides insights into the overall health of the Solana ecosystem.
+
+        :return: Dictionary with health metrics of the Solana ecosystem
+        """
+        health = self.ecosystem_health.copy()
+        
+        # Simulate changes in ecosystem metrics
+        health['tps'] += random.randint(-100, 100)
+        health['active_validators'] += random.randint
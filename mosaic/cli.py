@@ -0,0 +1,212 @@
+"""
+Command line interface exposing every mosaic agent as a subcommand.
+
+Only argparse and json are imported up front (not even typing, hence the
+builtin annotations); each subcommand imports its agent when it runs, so
+``mosaic --help`` and the non-navigator commands start without loading the
+Solana SDK.
+"""
+import argparse
+import json
+import sys
+
+from . import __version__
+
+
+def _to_jsonable(value: object) -> object:
+    """
+    Converts agent results into something json.dumps accepts, e.g. datetime keys.
+
+    :param value: Value returned by an agent
+    :return: A JSON serializable equivalent
+    """
+    if isinstance(value, dict):
+        return {k if isinstance(k, str) else str(k): _to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_jsonable(v) for v in value]
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+def _output(result: object):
+    """
+    Prints an agent result, as-is for strings and as indented JSON otherwise.
+
+    :param result: Value returned by an agent
+    """
+    if isinstance(result, str):
+        print(result)
+    else:
+        print(json.dumps(_to_jsonable(result), indent=2))
+
+
+def _load_json(path: str) -> object:
+    """
+    Loads a JSON document from a file, or from stdin when path is '-'.
+
+    :param path: Path of the JSON file
+    :return: The decoded document
+    """
+    if path == '-':
+        return json.load(sys.stdin)
+    with open(path) as f:
+        return json.load(f)
+
+
+def cmd_educate(args: argparse.Namespace):
+    from .llm import MosaicLLM
+
+    llm = MosaicLLM()
+    if args.feedback:
+        # Status line only; stdout carries the explanation itself
+        print(llm.adapt_knowledge_level(args.user_id, args.feedback), file=sys.stderr)
+    _output(llm.generate_content(args.topic, args.user_id))
+
+
+def cmd_command(args: argparse.Namespace):
+    from .commands import MosaicCommandLLM
+
+    llm = MosaicCommandLLM()
+    for text in args.text:
+        _output(llm.process_command(text))
+
+
+def cmd_analytics(args: argparse.Namespace):
+    from .analytics import MosaicAnalytics
+
+    analytics = MosaicAnalytics()
+    if args.action == 'predict':
+        _output(analytics.predict_market_trends(args.token, args.days))
+    else:
+        _output(analytics.analyze_token_performance(args.token))
+
+
+def cmd_insights(args: argparse.Namespace):
+    from .insights import UserBehaviorInsights
+
+    insights = UserBehaviorInsights()
+    for interaction in _load_json(args.interactions):
+        insights.record_interaction(interaction['user_id'], interaction['type'], interaction.get('details', {}))
+    _output(insights.analyze_user_behavior(args.user_id))
+
+
+def cmd_optimize(args: argparse.Namespace):
+    from .tx_optimizer import MosaicOptimizer
+
+    optimizer = MosaicOptimizer()
+    transaction = optimizer.optimize_transaction(args.amount, args.recipient, args.urgency)
+    if args.simulate:
+        optimizer.simulate_transaction(transaction)
+    else:
+        _output(transaction)
+
+
+def cmd_security(args: argparse.Namespace):
+    import contextlib
+    from .security_agent import MosaicSecurityAgent
+
+    agent = MosaicSecurityAgent(args.rpc_url)
+    for address in args.addresses:
+        agent.add_monitored_address(address)
+    # The agent prints alerts as it goes; keep stdout for the JSON result
+    with contextlib.redirect_stdout(sys.stderr):
+        agent.monitor_transactions()
+    _output({address: agent.get_recommendations(address) for address in agent.monitored_addresses})
+
+
+def cmd_navigate(args: argparse.Namespace):
+    import contextlib
+    from .navigators import MosaicNavigator
+
+    navigator = MosaicNavigator(args.rpc_url, args.public_key)
+    criteria = _load_json(args.criteria)
+    # The navigator reports progress with print; keep stdout machine-readable
+    with contextlib.redirect_stdout(sys.stderr):
+        navigator.guide_user(criteria)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the argument parser with one subcommand per agent.
+
+    :return: The configured parser
+    """
+    parser = argparse.ArgumentParser(prog='mosaic', description="AI agents for the Solana blockchain.")
+    parser.add_argument('--version', action='version', version=f"%(prog)s {__version__}")
+    parser.add_argument('--metrics', choices=['prometheus', 'json'],
+                        help="Print the collected method metrics to stderr after the command")
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND', required=True)
+
+    educate = subparsers.add_parser('educate', help="Explain a blockchain topic at the user's level")
+    educate.add_argument('topic', help="Topic to explain, e.g. blockchain or smart_contract")
+    educate.add_argument('user_id', help="User to tailor the explanation for")
+    educate.add_argument('--feedback', choices=['too simple', 'too complex'],
+                         help="Adapt the user's level before explaining")
+    educate.set_defaults(func=cmd_educate)
+
+    command = subparsers.add_parser('command', help="Run natural language blockchain commands")
+    command.add_argument('text', nargs='+', help="Command such as 'query balance of <address>'")
+    command.set_defaults(func=cmd_command)
+
+    analytics = subparsers.add_parser('analytics', help="Market trend prediction and token performance")
+    analytics.add_argument('action', choices=['predict', 'performance'])
+    analytics.add_argument('token', help="Token symbol, e.g. SOL")
+    analytics.add_argument('--days', type=int, default=7, help="Days to predict into the future")
+    analytics.set_defaults(func=cmd_analytics)
+
+    insights = subparsers.add_parser('insights', help="Analyze a user's recorded interactions")
+    insights.add_argument('user_id', help="User to analyze")
+    insights.add_argument('--interactions', required=True,
+                          help="JSON file ('-' for stdin) with a list of {user_id, type, details} objects")
+    insights.set_defaults(func=cmd_insights)
+
+    optimize = subparsers.add_parser('optimize', help="Optimize the timing and fee of a transaction")
+    optimize.add_argument('amount', type=int, help="Amount to transfer in lamports")
+    optimize.add_argument('recipient', help="Recipient's public key")
+    optimize.add_argument('--urgency', type=int, default=1, choices=range(1, 11), metavar='1-10')
+    optimize.add_argument('--simulate', action='store_true', help="Simulate executing the transaction")
+    optimize.set_defaults(func=cmd_optimize)
+
+    security = subparsers.add_parser('security', help="Monitor addresses for security threats")
+    security.add_argument('addresses', nargs='+', help="Addresses to monitor")
+    security.add_argument('--rpc-url', default='https://api.devnet.solana.com', help="Solana RPC node URL")
+    security.set_defaults(func=cmd_security)
+
+    navigate = subparsers.add_parser('navigate', help="Run staking and smart contract operations (needs solana)")
+    navigate.add_argument('public_key', help="User's public key on Solana")
+    navigate.add_argument('criteria', help="JSON file ('-' for stdin) with the operations to perform")
+    navigate.add_argument('--rpc-url', default='https://api.devnet.solana.com', help="Solana RPC node URL")
+    navigate.set_defaults(func=cmd_navigate)
+
+    return parser
+
+
+def main(argv: list = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        args.func(args)
+    except ModuleNotFoundError as e:
+        if e.name == 'solana':
+            print(f"mosaic {args.command}: the Solana SDK is not installed; "
+                  f"install it with pip install 'mosaic[solana]'", file=sys.stderr)
+            return 1
+        if (e.name or '').startswith('solana.'):
+            print(f"mosaic {args.command}: the installed Solana SDK does not provide {e.name}", file=sys.stderr)
+            return 1
+        raise
+    except KeyError as e:
+        print(f"mosaic {args.command}: missing field {e}", file=sys.stderr)
+        return 1
+    except (OSError, ValueError) as e:
+        # Unreadable or malformed input files, e.g. a JSONDecodeError
+        print(f"mosaic {args.command}: {e}", file=sys.stderr)
+        return 1
+
+    if args.metrics:
+        from . import metrics
+
+        # stderr, so that stdout holds nothing but the command's own result
+        print(metrics.export_prometheus() if args.metrics == 'prometheus' else metrics.export_json(indent=2),
+              file=sys.stderr)
+    return 0
@@ -0,0 +1,428 @@
+from typing import Callable, Dict, List
+import functools
+import json
+import math
+import os
+import threading
+import time
+
+# Sub-bucket resolution of the latency histograms: 2**5 = 32 linear buckets per
+# power of two, i.e. every recorded value is accurate to within ~3%.
+SUB_BUCKET_BITS = 5
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+BUCKET_COUNT = (64 - SUB_BUCKET_BITS) * SUB_BUCKET_COUNT + 2 * SUB_BUCKET_COUNT
+
+# Instrumented calls shorter than this look their bucket up in a precomputed
+# table instead of computing it, which is most of the cost of recording.
+TABLE_LIMIT = 1 << 14
+
+# Metrics can be disabled for the whole process with MOSAIC_METRICS=0. Methods
+# decorated while disabled are returned unwrapped, so they cost nothing at all.
+# disable() at runtime only skips recording: the wrapper call itself remains, a
+# few hundred nanoseconds per call, so it is not a substitute for the variable.
+_enabled = os.environ.get('MOSAIC_METRICS', '1').lower() not in ('0', 'false', 'off', 'no')
+_decorate = _enabled
+
+
+def _build_bucket_table(limit: int) -> List[int]:
+    """
+    Maps every value below limit to the index of its bucket.
+
+    :param limit: Power of two, at least 2 * SUB_BUCKET_COUNT
+    :return: List whose item at position value is LatencyHistogram.bucket_index(value)
+    """
+    table = list(range(2 * SUB_BUCKET_COUNT))
+    index = len(table)
+    while len(table) < limit:
+        # Buckets past the linear range are 2**shift values wide
+        table.extend([index] * (1 << ((index >> SUB_BUCKET_BITS) - 1)))
+        index += 1
+    return table
+
+
+_BUCKET_TABLE = _build_bucket_table(TABLE_LIMIT)
+
+
+class LatencyHistogram:
+    def __init__(self):
+        """
+        Initialize an HDR-style log-linear histogram of latencies in nanoseconds.
+        """
+        self.reset()
+
+    def reset(self):
+        """
+        Clears all recorded values in place.
+        """
+        # Count, min and max are derived from the buckets at snapshot time so that
+        # recording only touches one bucket and the running total.
+        if hasattr(self, 'counts'):
+            self.counts[:] = [0] * BUCKET_COUNT
+        else:
+            self.counts = [0] * BUCKET_COUNT
+        self.total = 0
+
+    @staticmethod
+    def bucket_index(value: int) -> int:
+        """
+        Returns the index of the bucket a value falls into.
+
+        :param value: Latency in nanoseconds
+        :return: Bucket index
+        """
+        if value < 2 * SUB_BUCKET_COUNT:
+            return value
+        shift = value.bit_length() - SUB_BUCKET_BITS - 1
+        return (shift << SUB_BUCKET_BITS) + (value >> shift)
+
+    def record(self, value: int):
+        """
+        Records a single latency value.
+
+        :param value: Latency in nanoseconds
+        """
+        self.counts[self.bucket_index(value)] += 1
+        self.total += value
+
+    @property
+    def count(self) -> int:
+        """
+        Number of recorded values.
+        """
+        return sum(self.counts)
+
+    @staticmethod
+    def _lowest_equivalent_value(index: int) -> int:
+        """
+        Returns the smallest value that falls into the bucket at the given index.
+
+        :param index: Bucket index
+        :return: Lower bound of the bucket in nanoseconds
+        """
+        if index < 2 * SUB_BUCKET_COUNT:
+            return index
+        shift = (index >> SUB_BUCKET_BITS) - 1
+        return (index - (shift << SUB_BUCKET_BITS)) << shift
+
+    @staticmethod
+    def _highest_equivalent_value(index: int) -> int:
+        """
+        Returns the largest value that falls into the bucket at the given index.
+
+        :param index: Bucket index
+        :return: Upper bound of the bucket in nanoseconds
+        """
+        if index < 2 * SUB_BUCKET_COUNT:
+            return index
+        shift = (index >> SUB_BUCKET_BITS) - 1
+        sub_bucket = index - (shift << SUB_BUCKET_BITS)
+        return ((sub_bucket + 1) << shift) - 1
+
+    def value_at_percentile(self, percentile: float) -> int:
+        """
+        Returns the recorded latency at the given percentile.
+
+        :param percentile: Percentile between 0 and 100
+        :return: Latency in nanoseconds, 0 if nothing was recorded
+        """
+        counts = list(self.counts)
+        total = sum(counts)
+        if not total:
+            return 0
+        target = max(math.ceil(percentile / 100 * total), 1)
+        seen = 0
+        for index, bucket_count in enumerate(counts):
+            seen += bucket_count
+            if seen >= target:
+                return self._highest_equivalent_value(index)
+        return 0
+
+    def snapshot(self, percentiles: List[float] = (50, 90, 99, 99.9)) -> Dict:
+        """
+        Summarizes the histogram.
+
+        :param percentiles: Percentiles to include in the summary
+        :return: Dictionary with count, sum, min, max, mean and percentiles in nanoseconds
+        """
+        counts = list(self.counts)
+        total = self.total
+        count = sum(counts)
+        used = [index for index, bucket_count in enumerate(counts) if bucket_count]
+        summary = {
+            'count': count,
+            'sum': total,
+            'min': self._lowest_equivalent_value(used[0]) if used else 0,
+            'max': self._highest_equivalent_value(used[-1]) if used else 0,
+            'mean': total / count if count else 0.0,
+        }
+        for percentile in percentiles:
+            summary[f"p{percentile:g}"] = self.value_at_percentile(percentile)
+        return summary
+
+
+class MethodMetrics:
+    def __init__(self, name: str):
+        """
+        Initialize the metrics tracked for a single instrumented method.
+
+        :param name: Fully qualified method name used as the metric label
+        """
+        self.name = name
+        # Completed calls are counted by the latency histogram, so the number of
+        # calls in flight is derived as started - completed.
+        self.started = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+
+    @property
+    def calls(self) -> int:
+        """
+        Number of completed calls, including those that raised.
+        """
+        return self.latency.count
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Number of calls currently running.
+        """
+        return self.started - self.latency.count
+
+    def reset(self):
+        """
+        Clears the counters and histogram in place; calls still running keep
+        being reported as in flight.
+        """
+        self.started -= self.latency.count
+        self.errors = 0
+        self.latency.reset()
+
+    def snapshot(self) -> Dict:
+        """
+        Summarizes the call/error counters, in-flight gauge and latency histogram.
+
+        :return: Dictionary with the current metric values
+        """
+        latency = self.latency.snapshot()
+        return {
+            'calls': latency['count'],
+            'errors': self.errors,
+            'in_flight': self.started - latency['count'],
+            'latency_ns': latency
+        }
+
+
+class MetricsRegistry:
+    def __init__(self):
+        """
+        Initialize an empty registry of per-method metrics.
+
+        Recording is lock-free to keep per-call overhead low; with many threads
+        calling the same method concurrently, counts may be slightly approximate.
+        """
+        self.methods = {}
+        self._lock = threading.Lock()
+
+    def method(self, name: str) -> MethodMetrics:
+        """
+        Returns the metrics for a method, creating them on first use.
+
+        :param name: Fully qualified method name
+        :return: The MethodMetrics registered under that name
+        """
+        with self._lock:
+            if name not in self.methods:
+                self.methods[name] = MethodMetrics(name)
+            return self.methods[name]
+
+    def reset(self):
+        """
+        Clears all recorded values while keeping registered methods.
+        """
+        with self._lock:
+            for metrics in self.methods.values():
+                metrics.reset()
+
+    def snapshot(self) -> Dict:
+        """
+        Takes a snapshot of all registered methods.
+
+        :return: Dictionary mapping method names to their metric values
+        """
+        with self._lock:
+            metrics = list(self.methods.values())
+        return {m.name: m.snapshot() for m in metrics}
+
+    def to_json(self, indent: int = None) -> str:
+        """
+        Exports a snapshot of the registry as JSON.
+
+        :param indent: Optional indentation passed to json.dumps
+        :return: JSON document with a timestamp and per-method metrics
+        """
+        return json.dumps({'timestamp': time.time(), 'methods': self.snapshot()}, indent=indent)
+
+    def to_prometheus(self) -> str:
+        """
+        Exports the registry in the Prometheus text exposition format.
+
+        :return: Prometheus text with calls/errors counters, an in-flight gauge
+                 and a latency summary per method
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        def family(metric: str, kind: str, help_text: str, key: str):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for name, values in snapshot.items():
+                lines.append(f'{metric}{{method="{_escape_label(name)}"}} {values[key]}')
+
+        family('mosaic_method_calls_total', 'counter', "Total calls of an instrumented method.", 'calls')
+        family('mosaic_method_errors_total', 'counter', "Calls of an instrumented method that raised.", 'errors')
+        family('mosaic_method_in_flight', 'gauge', "Calls of an instrumented method currently running.", 'in_flight')
+
+        lines.append("# HELP mosaic_method_latency_seconds Latency of an instrumented method.")
+        lines.append("# TYPE mosaic_method_latency_seconds summary")
+        for name, values in snapshot.items():
+            label = _escape_label(name)
+            latency = values['latency_ns']
+            for quantile, key in (('0.5', 'p50'), ('0.9', 'p90'), ('0.99', 'p99'), ('0.999', 'p99.9')):
+                lines.append(f'mosaic_method_latency_seconds{{method="{label}",quantile="{quantile}"}} '
+                             f'{latency[key] / 1e9:.9f}')
+            lines.append(f'mosaic_method_latency_seconds_sum{{method="{label}"}} {latency["sum"] / 1e9:.9f}')
+            lines.append(f'mosaic_method_latency_seconds_count{{method="{label}"}} {latency["count"]}')
+        return '\n'.join(lines) + '\n'
+
+
+def _escape_label(value: str) -> str:
+    """
+    Escapes a Prometheus label value.
+
+    :param value: Raw label value
+    :return: Escaped label value
+    """
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# Process-wide registry fed by the instrumented decorator
+REGISTRY = MetricsRegistry()
+
+
+def enable():
+    """
+    Turns recording on for methods decorated while metrics were enabled.
+    """
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """
+    Turns recording off. Instrumented methods still go through their wrapper,
+    which costs a Python function call plus a flag check; only MOSAIC_METRICS=0
+    at import time makes instrumentation free.
+    """
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """
+    Reports whether instrumented methods are currently recording.
+
+    :return: True if metrics are being recorded
+    """
+    return _enabled
+
+
+def instrumented(func: Callable = None, *, name: str = None, registry: MetricsRegistry = None) -> Callable:
+    """
+    Decorator feeding a method's latency, call/error counts and in-flight gauge
+    into the metrics registry.
+
+    Can be used bare (``@instrumented``) or with arguments
+    (``@instrumented(name='custom.name')``).
+
+    :param func: The function or method to instrument
+    :param name: Metric label, defaults to ``module.Class.method``
+    :param registry: Registry to record into, defaults to the process-wide REGISTRY
+    :return: The wrapped function, or func itself when MOSAIC_METRICS=0
+    """
+    if func is None:
+        return functools.partial(instrumented, name=name, registry=registry)
+    if not _decorate:
+        return func
+
+    metrics = (registry or REGISTRY).method(name or f"{func.__module__}.{func.__qualname__}")
+    latency = metrics.latency
+    counts = latency.counts
+    clock = time.perf_counter_ns
+    table = _BUCKET_TABLE
+    table_limit = TABLE_LIMIT
+    bits = SUB_BUCKET_BITS
+    precision = SUB_BUCKET_BITS + 1
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return func(*args, **kwargs)
+        metrics.started += 1
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            metrics.errors += 1
+            raise
+        finally:
+            elapsed = clock() - start
+            # Inlined LatencyHistogram.record, a method call would double the overhead
+            if elapsed < table_limit:
+                counts[table[elapsed]] += 1
+            else:
+                shift = elapsed.bit_length() - precision
+                counts[(shift << bits) + (elapsed >> shift)] += 1
+            latency.total += elapsed
+
+    return wrapper
+
+
+def snapshot() -> Dict:
+    """
+    Takes a snapshot of the process-wide registry.
+
+    :return: Dictionary mapping method names to their metric values
+    """
+    return REGISTRY.snapshot()
+
+
+def export_json(indent: int = None) -> str:
+    """
+    Exports the process-wide registry as JSON.
+
+    :param indent: Optional indentation passed to json.dumps
+    :return: JSON document with per-method metrics
+    """
+    return REGISTRY.to_json(indent)
+
+
+def export_prometheus() -> str:
+    """
+    Exports the process-wide registry in the Prometheus text format.
+
+    :return: Prometheus text exposition
+    """
+    return REGISTRY.to_prometheus()
+
+
+# Example usage
+if __name__ == "__main__":
+    @instrumented(name='example.sleep')
+    def sleep(seconds: float):
+        time.sleep(seconds)
+
+    for _ in range(10):
+        sleep(0.001)
+
+    print(export_prometheus())
+    print(export_json(indent=2))
@@ -0,0 +1,102 @@
+from typing import Dict, List
+from .metrics import instrumented
+
+class MosaicNavigator:
+    def __init__(self, rpc_url: str, user_public_key: str):
+        """
+        Initialize the Mosaic Navigator with the Solana RPC URL and user's public key.
+
+        :param rpc_url: URL of the Solana RPC node
+        :param user_public_key: User's public key on Solana
+        """
+        # The Solana SDK is imported on construction rather than at module level,
+        # so processes that never create a navigator do not pay for loading it
+        from solana.rpc.api import Client
+        from solana.publickey import PublicKey
+
+        self.client = Client(rpc_url)
+        self.user_public_key = PublicKey(user_public_key)
+        self.stake_program = None  # Created on first stake, see stake_sol
+
+    @instrumented
+    def stake_sol(self, amount: int, validator_public_key: str):
+        """
+        Automates the process of staking SOL to a validator based on user criteria.
+
+        :param amount: Amount of SOL to stake in lamports
+        :param validator_public_key: Public key of the validator to stake with
+        """
+        from solana.publickey import PublicKey
+        from solana.transaction import Transaction
+
+        if self.stake_program is None:
+            # No solana-py release ships solana.stake_program, so this raises
+            # ModuleNotFoundError until a stake program implementation is provided
+            from solana.stake_program import StakeProgram
+            self.stake_program = StakeProgram(self.client)
+
+        # Create a new stake account
+        stake_account = self.stake_program.create_stake_account(self.user_public_key, amount)
+        
+        # Delegate stake to the validator
+        transaction = Transaction().add(
+            self.stake_program.delegate_stake(
+                stake_account,
+                PublicKey(validator_public_key),
+                self.user_public_key
+            )
+        )
+        
+        # Simulate sending the transaction (in a real scenario, you'd sign and send)
+        print(f"Staking {amount / 1e9} SOL to validator {validator_public_key}")
+        # Here you would typically sign and send the transaction, but we're simulating
+
+    @instrumented
+    def interact_with_smart_contract(self, contract_address: str, function_name: str, args: List):
+        """
+        Simulates interaction with a smart contract on Solana.
+
+        :param contract_address: Address of the smart contract
+        :param function_name: Name of the function to call
+        :param args: Arguments to pass to the function
+        """
+        # In a real scenario, you would need to use a library to interact with the contract
+        print(f"Interacting with smart contract at {contract_address}")
+        print(f"Calling function: {function_name} with arguments: {args}")
+        # Here you would typically construct, sign, and send a transaction to call the function
+
+    @instrumented
+    def guide_user(self, user_criteria: Dict):
+        """
+        Guides the user through blockchain operations based on predefined criteria.
+
+        :param user_criteria: Dictionary containing user-defined operations and parameters
+        """
+        for operation, params in user_criteria.items():
+            if operation == 'stake':
+                self.stake_sol(params['amount'], params['validator'])
+            elif operation == 'smart_contract':
+                self.interact_with_smart_contract(params['contract_address'], params['function'], params['args'])
+            else:
+                print(f"Operation {operation} not recognized or supported yet.")
+
+# Example usage
+if __name__ == "__main__":
+    rpc_url = "https://api.devnet.solana.com"  # Example Devnet URL
+    user_public_key = "YourPublicKeyHere"  # User's public key
+    
+    navigator = MosaicNavigator(rpc_url, user_public_key)
+    
+    user_criteria = {
+        'stake': {
+            'amount': 1000000000,  # 1 SOL in lamports
+            'validator': 'ValidatorPublicKeyHere'
+        },
+        'smart_contract': {
+            'contract_address': 'SmartContractAddressHere',
+            'function': 'transfer',
+            'args': ['ToAddressHere', 500000000]  # Transfer half a SOL
+        }
+    }
+    
+    navigator.guide_user(user_criteria)
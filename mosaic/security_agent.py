@@ -0,0 +1,139 @@
+from typing import Dict, List
+from datetime import datetime
+import random  # For simulation purposes
+from .metrics import instrumented
+
+class MosaicSecurityAgent:
+    def __init__(self, rpc_url: str):
+        """
+        Initialize the MosaicSecurityAgent with the Solana RPC URL.
+
+        :param rpc_url: URL of the Solana RPC node
+        """
+        self.rpc_url = rpc_url  # In real scenario, you would use this to connect to Solana
+        self.monitored_addresses = []  # List of addresses to monitor
+        self.threat_patterns = {
+            'high_frequency': 100,  # Transactions per minute threshold
+            'large_transaction': 100000000000,  # 100 SOL in lamports
+            'unusual_contract': ['vulnerability1', 'vulnerability2']  # Known vulnerabilities
+        }
+        self.alerts = []  # Store alerts
+
+    @instrumented
+    def add_monitored_address(self, address: str):
+        """
+        Add an address to be monitored for security threats.
+
+        :param address: The Solana address to monitor
+        """
+        if address not in self.monitored_addresses:
+            self.monitored_addresses.append(address)
+
+    @instrumented
+    def monitor_transactions(self):
+        """
+        Simulates monitoring transactions for unusual patterns or threats.
+        """
+        for address in self.monitored_addresses:
+            # Simulate fetching transaction data
+            recent_transactions = self._simulate_fetch_transactions(address)
+            
+            # Check for high frequency of transactions
+            if self._check_high_frequency(recent_transactions):
+                self._alert("High frequency of transactions detected", address)
+            
+            # Check for large transactions
+            for tx in recent_transactions:
+                if tx['amount'] > self.threat_patterns['large_transaction']:
+                    self._alert("Large transaction detected", address, tx['amount'])
+            
+            # Check for smart contract vulnerabilities
+            for contract in self._simulate_smart_contracts(address):
+                if contract['vulnerability'] in self.threat_patterns['unusual_contract']:
+                    self._alert(f"Smart contract vulnerability detected: {contract['vulnerability']}", address)
+
+    def _simulate_fetch_transactions(self, address: str) -> List[Dict]:
+        """
+        Simulates fetching recent transactions for an address.
+
+        :param address: The address to fetch transactions for
+        :return: List of simulated transaction data
+        """
+        # In a real scenario, you would query the Solana blockchain for transactions
+        return [{'amount': random.randint(1000000, 100000000000)} for _ in range(random.randint(1, 200))]
+
+    def _check_high_frequency(self, transactions: List[Dict]) -> bool:
+        """
+        Checks if the transaction frequency is above the threshold.
+
+        :param transactions: List of transaction data
+        :return: Boolean indicating if frequency is high
+        """
+        return len(transactions) > self.threat_patterns['high_frequency']
+
+    def _simulate_smart_contracts(self, address: str) -> List[Dict]:
+        """
+        Simulates checking smart contracts associated with an address for vulnerabilities.
+
+        :param address: The address to check contracts for
+        :return: List of simulated smart contract data
+        """
+        # In reality, you would interact with the blockchain to check smart contracts
+        return [{'vulnerability': random.choice(self.threat_patterns['unusual_contract'])} for _ in range(random.randint(0, 5))]
+
+    def _alert(self, message: str, address: str, additional_info: any = None):
+        """
+        Logs an alert with a timestamp, message, and address.
+
+        :param message: The alert message
+        :param address: The address associated with the alert
+        :param additional_info: Any additional information to include in the alert
+        """
+        alert = {
+            'timestamp': datetime.now().isoformat(),
+            'message': message,
+            'address': address,
+            'additional_info': additional_info
+        }
+        self.alerts.append(alert)
+        print(f"Alert: {alert}")
+
+    @instrumented
+    def get_recommendations(self, address: str) -> List[str]:
+        """
+        Provides security recommendations based on detected threats.
+
+        :param address: The address to provide recommendations for
+        :return: List of security recommendations
+        """
+        recommendations = []
+        for alert in self.alerts:
+            if alert['address'] == address:
+                if 'High frequency' in alert['message']:
+                    recommendations.append("Consider implementing rate limiting or transaction delays.")
+                elif 'Large transaction' in alert['message']:
+                    recommendations.append("Verify the legitimacy of large transactions and consider multi-signature wallets.")
+                elif 'vulnerability' in alert['message']:
+                    recommendations.append(f"Update or audit the smart contract for {alert['additional_info']}.")
+        return recommendations
+
+# Example usage
+if __name__ == "__main__":
+    security_agent = MosaicSecurityAgent("https://api.devnet.solana.com")
+    
+    # Add addresses to monitor
+    security_agent.add_monitored_address("Address1")
+    security_agent.add_monitored_address("Address2")
+    
+    # Simulate monitoring
+    security_agent.monitor_transactions()
+    
+    # Get recommendations for an address
+    for address in security_agent.monitored_addresses:
+        recommendations = security_agent.get_recommendations(address)
+        if recommendations:
+            print(f"Security Recommendations for {address}:")
+            for recommendation in recommendations:
+                print(f"- {recommendation}")
+        else:
+            print(f"No security issues detected for {address}")
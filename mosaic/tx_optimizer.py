@@ -0,0 +1,118 @@
+from typing import Dict, List
+from datetime import datetime, timedelta
+import random  # For simulation purposes
+from .metrics import instrumented
+
+class MosaicOptimizer:
+    def __init__(self):
+        """
+        Initialize the MosaicOptimizer with necessary attributes to manage transaction optimization.
+        """
+        self.current_network_congestion = 0  # Simulated network congestion level
+        self.historical_data = []  # Store historical transaction data
+        self.fee_structure = {
+            'base_fee': 5000,  # In lamports, as per Solana's current fee structure
+            'priority_fee': 0  # Initial priority fee, will be adjusted
+        }
+
+    def analyze_network_congestion(self) -> float:
+        """
+        Simulates analysis of current network congestion on Solana.
+
+        :return: A simulated congestion level between 0 and 1.
+        """
+        # In real-world, this would involve querying Solana's network status
+        self.current_network_congestion = random.uniform(0, 1)
+        return self.current_network_congestion
+
+    def predict_best_transaction_time(self, time_window: int = 24) -> datetime:
+        """
+        Predicts the optimal time for a transaction based on historical data and current congestion.
+
+        :param time_window: Time window in hours to predict within
+        :return: Predicted best time for transaction
+        """
+        # Simulate prediction based on historical data
+        now = datetime.now()
+        lowest_congestion_time = min(self.historical_data, key=lambda x: x['congestion'], default={'time': now, 'congestion': 1})
+        
+        # Adjust for current conditions
+        future_time = lowest_congestion_time['time'] + timedelta(hours=random.randint(0, time_window))
+        return future_time if future_time > now else now
+
+    def calculate_optimal_fee(self, urgency: int = 1) -> Dict:
+        """
+        Calculates the optimal fee structure based on urgency and network conditions.
+
+        :param urgency: Level of urgency for transaction (1-10, where 10 is highest)
+        :return: A dictionary with updated fee structure
+        """
+        base_fee = self.fee_structure['base_fee']
+        congestion_factor = self.current_network_congestion
+        
+        # Adjust priority fee based on urgency and congestion
+        priority_fee = base_fee * (urgency / 10) * (1 + congestion_factor)
+        
+        return {
+            'base_fee': base_fee,
+            'priority_fee': int(priority_fee)
+        }
+
+    # The helpers above are left uninstrumented: optimize_transaction's own metrics
+    # cover them, and wrapping them too would quadruple its per-call overhead.
+    @instrumented
+    def optimize_transaction(self, amount: int, recipient: str, urgency: int = 1) -> Dict:
+        """
+        Optimizes a transaction by determining the best time and fee structure.
+
+        :param amount: Amount to transfer in lamports
+        :param recipient: Recipient's public key
+        :param urgency: Urgency level of the transaction
+        :return: A dictionary containing transaction details with optimized parameters
+        """
+        # Analyze current network conditions
+        self.analyze_network_congestion()
+        
+        # Predict the best time for transaction
+        best_time = self.predict_best_transaction_time()
+        
+        # Calculate optimal fee
+        optimal_fee = self.calculate_optimal_fee(urgency)
+        
+        # Store transaction data for future analysis
+        self.historical_data.append({
+            'time': best_time,
+            'congestion': self.current_network_congestion,
+            'fee': optimal_fee['priority_fee']
+        })
+        
+        return {
+            'amount': amount,
+            'recipient': recipient,
+            'time': best_time,
+            'fee': optimal_fee
+        }
+
+    @instrumented
+    def simulate_transaction(self, transaction_details: Dict):
+        """
+        Simulates the execution of a transaction with the optimized parameters.
+
+        :param transaction_details: Dictionary containing transaction details
+        """
+        print(f"Simulating transaction: Sending {transaction_details['amount'] / 1e9} SOL to {transaction_details['recipient']}")
+        print(f"Optimal Time: {transaction_details['time']}")
+        print(f"Transaction Fee: Base {transaction_details['fee']['base_fee'] / 1e9} SOL, Priority {transaction_details['fee']['priority_fee'] / 1e9} SOL")
+
+# Example usage
+if __name__ == "__main__":
+    optimizer = MosaicOptimizer()
+    
+    # Example transaction
+    transaction = optimizer.optimize_transaction(
+        amount=1000000000,  # 1 SOL in lamports
+        recipient="RecipientPublicKeyHere",
+        urgency=5  # Medium urgency
+    )
+    
+    optimizer.simulate_transaction(transaction)
@@ -0,0 +1,139 @@
+import importlib.util
+import json
+
+import pytest
+
+from mosaic import cli, metrics
+
+ADDRESS = 'A' * 32
+
+
+def run(capsys, *argv):
+    code = cli.main(list(argv))
+    out, err = capsys.readouterr()
+    return code, out, err
+
+
+def test_educate(capsys):
+    code, out, err = run(capsys, 'educate', 'blockchain', 'User1')
+    assert code == 0
+    assert out.startswith("A blockchain is like a digital ledger")
+    assert err == ''
+
+
+def test_educate_feedback_goes_to_stderr(capsys):
+    code, out, err = run(capsys, 'educate', 'blockchain', 'User1', '--feedback', 'too simple')
+    assert code == 0
+    assert out.startswith("Blockchain technology is a decentralized database")
+    assert err == "Knowledge level for User1 updated to intermediate.\n"
+
+
+def test_command(capsys):
+    code, out, _ = run(capsys, 'command', f"query balance of {ADDRESS}", 'hello')
+    assert code == 0
+    assert out.splitlines() == [f"Address {ADDRESS} not found or has no balance.",
+                                "I'm sorry, I didn't understand that command. Please try again or ask for help."]
+
+
+def test_analytics_predict(capsys):
+    code, out, _ = run(capsys, 'analytics', 'predict', 'SOL', '--days', '3')
+    assert code == 0
+    assert len(json.loads(out)) == 3
+
+
+def test_analytics_performance(capsys):
+    code, out, _ = run(capsys, 'analytics', 'performance', 'SOL')
+    assert code == 0
+    assert json.loads(out)['price'] == 100
+
+
+def test_insights(capsys, tmp_path):
+    path = tmp_path / 'interactions.json'
+    path.write_text(json.dumps([{'user_id': 'u1', 'type': 'query'}, {'user_id': 'u1', 'type': 'staking'},
+                                {'user_id': 'u2', 'type': 'query'}]))
+    code, out, _ = run(capsys, 'insights', 'u1', '--interactions', str(path))
+    assert code == 0
+    insights = json.loads(out)
+    assert insights['total_interactions'] == 2
+    assert insights['interaction_types'] == {'query': 1, 'staking': 1}
+
+
+def test_optimize(capsys):
+    code, out, _ = run(capsys, 'optimize', '1000', ADDRESS, '--urgency', '5')
+    assert code == 0
+    transaction = json.loads(out)
+    assert transaction['amount'] == 1000
+    assert transaction['recipient'] == ADDRESS
+    assert transaction['fee']['base_fee'] == 5000
+
+
+def test_optimize_simulate(capsys):
+    code, out, _ = run(capsys, 'optimize', '1000000000', ADDRESS, '--simulate')
+    assert code == 0
+    assert out.startswith(f"Simulating transaction: Sending 1.0 SOL to {ADDRESS}")
+
+
+def test_security_keeps_alerts_off_stdout(capsys):
+    code, out, _ = run(capsys, 'security', ADDRESS, 'B' * 32)
+    assert code == 0
+    assert set(json.loads(out)) == {ADDRESS, 'B' * 32}
+
+
+@pytest.mark.skipif(not metrics._decorate, reason="MOSAIC_METRICS=0 leaves methods unwrapped")
+def test_metrics_go_to_stderr(capsys):
+    code, out, err = run(capsys, '--metrics', 'json', 'analytics', 'performance', 'SOL')
+    assert code == 0
+    assert json.loads(out)['price'] == 100
+    assert 'mosaic.analytics.MosaicAnalytics.analyze_token_performance' in json.loads(err)['methods']
+
+
+@pytest.mark.parametrize('content, message', [
+    ('', "Expecting value"),
+    ('[{"type": "query"}]', "missing field 'user_id'"),
+])
+def test_bad_interactions_file(capsys, tmp_path, content, message):
+    path = tmp_path / 'interactions.json'
+    path.write_text(content)
+    code, out, err = run(capsys, 'insights', 'u1', '--interactions', str(path))
+    assert code == 1
+    assert out == ''
+    assert err.startswith("mosaic insights: ") and message in err
+    assert err.count('\n') == 1
+
+
+def test_missing_interactions_file(capsys, tmp_path):
+    code, _, err = run(capsys, 'insights', 'u1', '--interactions', str(tmp_path / 'missing.json'))
+    assert code == 1
+    assert err.startswith("mosaic insights: [Errno 2] No such file or directory")
+
+
+@pytest.mark.skipif(importlib.util.find_spec('solana') is not None, reason="the Solana SDK is installed")
+def test_navigate_without_solana(capsys, tmp_path):
+    path = tmp_path / 'criteria.json'
+    path.write_text('{}')
+    code, _, err = run(capsys, 'navigate', ADDRESS, str(path))
+    assert code == 1
+    assert "the Solana SDK is not installed" in err
+
+
+@pytest.mark.parametrize('module_name, message', [
+    ('solana', "the Solana SDK is not installed"),
+    ('solana.stake_program', "the installed Solana SDK does not provide solana.stake_program"),
+])
+def test_missing_solana_module(capsys, monkeypatch, module_name, message):
+    def handler(args):
+        raise ModuleNotFoundError(f"No module named {module_name!r}", name=module_name)
+
+    monkeypatch.setattr(cli, 'cmd_analytics', handler)
+    code, _, err = run(capsys, 'analytics', 'predict', 'SOL')
+    assert code == 1
+    assert err.startswith("mosaic analytics: ") and message in err
+
+
+def test_other_missing_module_is_raised(monkeypatch):
+    def handler(args):
+        raise ModuleNotFoundError("No module named 'numpy'", name='numpy')
+
+    monkeypatch.setattr(cli, 'cmd_analytics', handler)
+    with pytest.raises(ModuleNotFoundError):
+        cli.main(['analytics', 'predict', 'SOL'])
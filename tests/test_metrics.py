@@ -0,0 +1,161 @@
+import itertools
+import json
+import random
+
+import pytest
+
+from mosaic import metrics
+from mosaic.metrics import LatencyHistogram, MetricsRegistry, instrumented
+
+pytestmark = pytest.mark.skipif(not metrics._decorate, reason="MOSAIC_METRICS=0 leaves methods unwrapped")
+
+# Values around every power of two up to 2**62, plus the linear range
+BOUNDARY_VALUES = sorted({0, 1, 63, 64, 65, 127, 128} |
+                         {v for shift in range(6, 63) for v in ((1 << shift) - 1, 1 << shift, (1 << shift) + 1)})
+
+
+@pytest.mark.parametrize('value', BOUNDARY_VALUES)
+def test_bucket_bounds_contain_value(value):
+    index = LatencyHistogram.bucket_index(value)
+    assert LatencyHistogram._lowest_equivalent_value(index) <= value <= LatencyHistogram._highest_equivalent_value(index)
+
+
+def test_bucket_bounds_are_contiguous():
+    for index in range(1, metrics.BUCKET_COUNT):
+        low = LatencyHistogram._lowest_equivalent_value(index)
+        assert low == LatencyHistogram._highest_equivalent_value(index - 1) + 1
+        assert LatencyHistogram.bucket_index(low) == index
+
+
+def test_percentiles_on_known_distribution():
+    histogram = LatencyHistogram()
+    for value in range(1, 10001):
+        histogram.record(value * 1000)
+
+    summary = histogram.snapshot()
+    assert summary['count'] == 10000
+    assert summary['sum'] == sum(v * 1000 for v in range(1, 10001))
+    for percentile, exact in ((50, 5_000_000), (90, 9_000_000), (99, 9_900_000)):
+        assert exact <= summary[f"p{percentile}"] <= exact * (1 + 1 / metrics.SUB_BUCKET_COUNT)
+    assert summary['min'] <= 1000 <= LatencyHistogram._highest_equivalent_value(LatencyHistogram.bucket_index(1000))
+    assert summary['max'] >= 10_000_000
+
+
+def test_bucket_table_matches_bucket_index():
+    assert len(metrics._BUCKET_TABLE) == metrics.TABLE_LIMIT
+    assert all(index == LatencyHistogram.bucket_index(value) for value, index in enumerate(metrics._BUCKET_TABLE))
+
+
+def test_percentile_uses_nearest_rank():
+    histogram = LatencyHistogram()
+    for value in range(1, 11):
+        histogram.record(value)
+
+    # Nearest rank: the ceil(p/100 * n)-th smallest value
+    assert histogram.value_at_percentile(25) == 3
+    assert histogram.value_at_percentile(50) == 5
+    assert histogram.value_at_percentile(91) == 10
+    assert histogram.value_at_percentile(100) == 10
+
+
+def test_empty_histogram_snapshot():
+    summary = LatencyHistogram().snapshot()
+    assert summary['count'] == 0
+    assert summary['p50'] == 0
+    assert summary['mean'] == 0.0
+
+
+def test_error_counter_on_raise():
+    registry = MetricsRegistry()
+
+    @instrumented(name='test.boom', registry=registry)
+    def boom(fail: bool):
+        if fail:
+            raise ValueError("boom")
+        return 'ok'
+
+    assert boom(False) == 'ok'
+    with pytest.raises(ValueError):
+        boom(True)
+
+    snapshot = registry.snapshot()['test.boom']
+    assert snapshot['calls'] == 2
+    assert snapshot['errors'] == 1
+    assert snapshot['in_flight'] == 0
+
+
+def test_in_flight_survives_reset_during_call():
+    registry = MetricsRegistry()
+    seen = {}
+
+    @instrumented(name='test.reset', registry=registry)
+    def resetting():
+        registry.reset()
+        seen.update(registry.snapshot()['test.reset'])
+
+    resetting()
+    assert seen['in_flight'] == 1
+    assert seen['calls'] == 0
+
+    snapshot = registry.snapshot()['test.reset']
+    assert snapshot['in_flight'] == 0
+    assert snapshot['calls'] == 1
+
+
+def test_disabled_does_not_record():
+    registry = MetricsRegistry()
+
+    @instrumented(name='test.disabled', registry=registry)
+    def noop():
+        return 1
+
+    metrics.disable()
+    try:
+        assert noop() == 1
+    finally:
+        metrics.enable()
+    assert registry.snapshot()['test.disabled']['calls'] == 0
+
+
+def test_wrapper_matches_histogram_record(monkeypatch):
+    rng = random.Random(42)
+    durations = BOUNDARY_VALUES + [rng.randrange(1 << rng.randrange(1, 50)) for _ in range(2000)]
+    # Each call reads the clock twice: start at 0, end at the duration
+    ticks = itertools.chain.from_iterable((0, duration) for duration in durations)
+    monkeypatch.setattr(metrics.time, 'perf_counter_ns', lambda: next(ticks))
+
+    registry = MetricsRegistry()
+    wrapped = instrumented(lambda: None, name='test.clock', registry=registry)
+    for _ in durations:
+        wrapped()
+    monkeypatch.undo()
+
+    expected = LatencyHistogram()
+    for duration in durations:
+        expected.record(duration)
+    assert registry.methods['test.clock'].latency.counts == expected.counts
+    assert registry.methods['test.clock'].latency.total == expected.total
+
+
+def test_exports():
+    registry = MetricsRegistry()
+
+    @instrumented(name='test."quoted"', registry=registry)
+    def noop():
+        pass
+
+    noop()
+    text = registry.to_prometheus()
+    assert 'mosaic_method_calls_total{method="test.\\"quoted\\""} 1' in text
+    assert '# TYPE mosaic_method_latency_seconds summary' in text
+    assert json.loads(registry.to_json())['methods']['test."quoted"']['calls'] == 1
+
+
+def test_optimizer_records_one_call_per_optimization():
+    from mosaic.tx_optimizer import MosaicOptimizer
+
+    metrics.REGISTRY.reset()
+    MosaicOptimizer().optimize_transaction(1000, 'recipient')
+    snapshot = metrics.snapshot()
+    assert snapshot['mosaic.tx_optimizer.MosaicOptimizer.optimize_transaction']['calls'] == 1
+    assert 'mosaic.tx_optimizer.MosaicOptimizer.calculate_optimal_fee' not in snapshot
@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import mosaic
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize('name, module_name', sorted(mosaic._LAZY_ATTRIBUTES.items()))
+def test_lazy_attribute_resolves_and_is_cached(monkeypatch, name, module_name):
+    monkeypatch.delitem(vars(mosaic), name, raising=False)
+
+    value = getattr(mosaic, name)
+    assert value.__name__ == name
+    assert value.__module__ == module_name
+    assert vars(mosaic)[name] is value
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError, match='NoSuchAgent'):
+        mosaic.NoSuchAgent
+
+
+def test_dir_lists_lazy_attributes():
+    assert set(mosaic._LAZY_ATTRIBUTES) <= set(dir(mosaic))
+
+
+def test_agents_without_navigator_do_not_load_solana():
+    names = [name for name in mosaic._LAZY_ATTRIBUTES if name != 'MosaicNavigator']
+    code = (f"import sys, mosaic\n"
+            f"for name in {names!r}:\n"
+            f"    getattr(mosaic, name)\n"
+            f"print(sorted(m for m in sys.modules if m == 'solana' or m.startswith('solana.')))\n")
+    result = subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == '[]'